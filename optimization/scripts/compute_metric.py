@@ -8,7 +8,7 @@
 Compute field-based metrics from OpenFOAM case using ParaView.
 
 Usage:
-    pvpython compute_metric.py <case_dir> <metric_name>
+    pvpython compute_metric.py <case_dir> <metric_name>[,<metric_name>...] [--time=TIME | --times=T0,T1,...] [--foam-file=PATH]
 
 Available metrics:
     combustion_efficiency    - Fuel conversion efficiency (0-1)
@@ -18,15 +18,32 @@ Available metrics:
 
 Note: pressure_loss has been moved to get_metric.sh for faster extraction from logs
 
-Outputs only the scalar metric value, or error message with traceback.
+Several comma-separated metrics can be requested at once; the volume metrics
+then share a single integration pass over the mesh.
+
+Outputs only the scalar metric value (one line per requested metric, in order),
+or error message with traceback. With --times, the case is loaded once and one
+line per time step is printed instead: the time followed by the metric values.
+
+Decomposed cases can be read in parallel by setting COMPUTE_METRIC_NPROCS>1:
+the script is then re-launched with pvbatch under mpiexec when both are on
+PATH (see mpi_command). By default everything runs in a single process.
 """
 
+import mmap
+import os
+import re
+import shutil
+import subprocess
 import sys
 import traceback
+from functools import lru_cache
 from pathlib import Path
 
-from paraview.simple import *
-import vtk
+import numpy as np
+
+# ParaView is imported inside the functions that use it, so argument errors
+# are reported without paying for loading its libraries
 
 try:
     from foamlib import FoamFile
@@ -35,9 +52,178 @@ except ImportError:
     FOAMLIB_AVAILABLE = False
 
 
+# Cell arrays each metric needs from the reader; nothing else is loaded
+METRIC_FIELDS = {
+    'combustion_efficiency': ['CH4'],
+    'ch4_domain_average': ['CH4'],
+    'pattern_factor': ['T'],
+    'temperature_rise': ['T'],
+}
+
+# Mesh regions each metric needs; volume metrics only integrate the internal mesh
+METRIC_REGIONS = {
+    'combustion_efficiency': ['internalMesh', 'patch/outlet'],
+    'ch4_domain_average': ['internalMesh'],
+    'pattern_factor': ['internalMesh'],
+    'temperature_rise': ['internalMesh'],
+}
+
+# C/C++ comments, with quoted strings matched first so '//' inside them is skipped
+COMMENT_PATTERN = re.compile(rb'("(?:[^"\\]|\\.)*")|//[^\n]*|/\*.*?\*/', re.S)
+
+# Innermost brace-delimited sub-dictionary (comments and strings removed first)
+NESTED_DICT_PATTERN = re.compile(rb'\{[^{}]*\}')
+
+# 'format binary;' in the FoamFile header
+BINARY_FORMAT_PATTERN = re.compile(rb'(?<!\w)format\s+binary\s*;')
+
+# 'value'/'inletValue' entries of a patch dictionary, e.g. "value uniform 300;"
+VALUE_ENTRY_PATTERNS = [
+    re.compile(rb'(?<![\w"])' + key + rb'\s+([^;]*);')
+    for key in (b'value', b'inletValue')
+]
+
+# Scalar uniform value of such an entry
+UNIFORM_SCALAR_PATTERN = re.compile(rb'uniform\s+([-+\d.eE]+)\s*')
+
+
+def _boundary_field_offset(data):
+    """Offset of the boundaryField keyword outside comments, or None."""
+    keyword = b'boundaryField'
+    pos = data.find(keyword)
+    while pos != -1:
+        # Plain find (no regex scan over the internalField data); whole words only
+        before = data[pos - 1:pos]
+        after = data[pos + len(keyword):pos + len(keyword) + 1]
+        if re.fullmatch(rb'[\w."]', before) or re.fullmatch(rb'[\w."]', after):
+            pos = data.find(keyword, pos + 1)
+            continue
+        line_start = data.rfind(b'\n', 0, pos) + 1
+        in_line_comment = data.find(b'//', line_start, pos) != -1
+        in_block_comment = data.rfind(b'/*', 0, pos) > data.rfind(b'*/', 0, pos)
+        if not (in_line_comment or in_block_comment):
+            return pos
+        pos = data.find(keyword, pos + 1)
+    return None
+
+
+def _find_patch_block(data, patch_name):
+    """
+    Locate the body of a patch dictionary inside boundaryField.
+
+    The scan starts at the boundaryField keyword, so the header and the
+    internalField data (possibly a large nonuniform list) are never
+    tokenized. From there comments and quoted strings are skipped and braces
+    are matched by depth, so nested sub-dictionaries stay inside the body,
+    as foamlib reads it.
+
+    Returns:
+        (start, end) offsets of the text between the patch's braces, or None
+    """
+    tokens = re.compile(
+        rb'//[^\n]*|/\*.*?\*/|"(?:[^"\\]|\\.)*"|[{}]'
+        rb'|(?<![\w."])(boundaryField|' + re.escape(patch_name.encode()) + rb')(?![\w."])'
+        # Runs of numbers and list parentheses, so that nonuniform patch
+        # values are skipped a run at a time
+        rb'|([-+.()\d\s]+)',
+        re.S,
+    )
+    offset = _boundary_field_offset(data)
+    if offset is None:
+        return None
+
+    depth = 0
+    keyword = None      # keyword waiting for its '{', and the offset after it
+    in_boundary = False
+    start = None
+    for match in tokens.finditer(data, offset):
+        token = match.group()
+        if match.group(1):
+            keyword, keyword_end = token, match.end()
+        elif match.group(2):
+            # Whitespace between a keyword and its '{' is checked below
+            continue
+        elif token.startswith((b'//', b'/*')):
+            # Comments may sit between a keyword and its '{'
+            if keyword is not None:
+                keyword_end = match.end()
+        elif token == b'{':
+            depth += 1
+            opens = keyword if keyword is not None and not data[keyword_end:match.start()].strip() else None
+            if depth == 1 and opens == b'boundaryField':
+                in_boundary = True
+            elif depth == 2 and in_boundary and opens is not None and opens != b'boundaryField':
+                start = match.end()
+            keyword = None
+        elif token == b'}':
+            if depth == 2 and start is not None:
+                return start, match.start()
+            if depth == 1 and in_boundary:
+                return None
+            depth -= 1
+            keyword = None
+        else:
+            keyword = None
+    return None
+
+
+def _strip_comments(text):
+    """Replace the comments in dictionary text by a space each, and quoted strings by empty ones."""
+    return COMMENT_PATTERN.sub(lambda match: b'""' if match.group(1) else b' ', text)
+
+
+def _top_level_text(body):
+    """Patch body without comments, strings and nested sub-dictionaries."""
+    body = _strip_comments(body)
+    while True:
+        body, count = NESTED_DICT_PATTERN.subn(b' ', body)
+        if not count:
+            return body
+
+
+def _scan_uniform_value(field_file, patch_name):
+    """
+    Fast path for read_boundary_condition: scan the memory-mapped field
+    file for the patch's scalar uniform value.
+
+    The patch body is located by _find_patch_block, then its top-level
+    entries are matched against VALUE_ENTRY_PATTERNS. Binary-format files
+    are left to foamlib, as their data can hold any byte.
+
+    Returns:
+        The value, or None if it could not be found this way (non-uniform or
+        vector values, regex patch names, binary files, ...) and foamlib
+        should be used
+    """
+    with open(field_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if BINARY_FORMAT_PATTERN.search(_strip_comments(data[:4096])):
+            return None
+        bounds = _find_patch_block(data, patch_name)
+        if bounds is None:
+            return None
+        body = data[bounds[0]:bounds[1]]
+
+    # Commented-out entries (e.g. an old "// value uniform 350;") and
+    # entries of nested sub-dictionaries must not match
+    body = _top_level_text(body)
+
+    # Same precedence as the foamlib path: 'value' before 'inletValue', and
+    # the last of duplicate entries wins
+    for pattern in VALUE_ENTRY_PATTERNS:
+        entries = pattern.findall(body)
+        if entries:
+            match = UNIFORM_SCALAR_PATTERN.fullmatch(entries[-1])
+            return float(match.group(1)) if match else None
+    return None
+
+
 def read_boundary_condition(case_dir, field_name, patch_name, fallback_value):
     """
-    Read boundary condition value from OpenFOAM field file using foamlib.
+    Read boundary condition value from OpenFOAM field file.
+
+    Parsed values are memoized per field file and modification time (see
+    _read_boundary_value), so a long-lived process re-reads a rewritten file;
+    the fallback itself is never cached, so a missing file is probed again.
 
     Args:
         case_dir: Path to case directory
@@ -48,16 +234,37 @@ def read_boundary_condition(case_dir, field_name, patch_name, fallback_value):
     Returns:
         Boundary value (scalar or first component for vectors)
     """
-    if not FOAMLIB_AVAILABLE:
-        return fallback_value
+    for time_dir in ("0.orig", "0"):
+        field_file = Path(case_dir) / time_dir / field_name
+        try:
+            mtime_ns = os.stat(field_file).st_mtime_ns
+        except OSError:
+            continue
+        value = _read_boundary_value(str(field_file), mtime_ns, patch_name)
+        return fallback_value if value is None else value
+
+    return fallback_value
+
 
+@lru_cache(maxsize=32)
+def _read_boundary_value(field_file, mtime_ns, patch_name):
+    """
+    Cached worker for read_boundary_condition; mtime_ns only keys the cache.
+
+    Scalar uniform values are picked by _scan_uniform_value; anything else is
+    parsed with foamlib.
+
+    Returns:
+        The value, or None if it could not be read
+    """
     try:
-        field_file = Path(case_dir) / "0.orig" / field_name
-        if not field_file.exists():
-            field_file = Path(case_dir) / "0" / field_name
+        # Fast path: no need to tokenize the whole dictionary for one scalar
+        value = _scan_uniform_value(field_file, patch_name)
+        if value is not None:
+            return value
 
-        if not field_file.exists():
-            return fallback_value
+        if not FOAMLIB_AVAILABLE:
+            return None
 
         # Read using foamlib
         foam_file = FoamFile(field_file)
@@ -66,7 +273,7 @@ def read_boundary_condition(case_dir, field_name, patch_name, fallback_value):
         boundary_field = foam_file["boundaryField"]
 
         if patch_name not in boundary_field:
-            return fallback_value
+            return None
 
         patch_data = boundary_field[patch_name]
 
@@ -76,18 +283,14 @@ def read_boundary_condition(case_dir, field_name, patch_name, fallback_value):
         elif "inletValue" in patch_data:
             value = patch_data["inletValue"]
         else:
-            return fallback_value
+            return None
 
-        # Handle uniform values
-        if hasattr(value, '__iter__') and not isinstance(value, str):
-            # For vectors, return first component or magnitude
-            if len(value) > 0:
-                return float(value[0]) if len(value) == 1 else float(value)
-        else:
-            return float(value)
+        # Handle uniform values: scalars and 1-element sequences convert once,
+        # at the end (vectors raise and use the fallback, as before)
+        return np.asarray(value, dtype=np.float64).item()
 
-    except Exception as e:
-        return fallback_value
+    except Exception:
+        return None
 
 
 def get_inlet_conditions(case_dir):
@@ -109,6 +312,37 @@ def get_inlet_conditions(case_dir):
     }
 
 
+def _reader_key(case_reader):
+    """
+    Stable cache key for a reader proxy.
+
+    Unlike id() of the Python wrapper, the proxy's global ID is never reused
+    by a later reader within the session.
+    """
+    return case_reader.GetGlobalIDAsString()
+
+
+# Outlet integration pipelines, keyed by (_reader_key(case_reader), patch
+# name); built once and re-executed for every request/time step on the same
+# reader, and deleted with it by release_reader()
+_outlet_pipelines = {}
+
+
+def _outlet_pipeline(case_reader, outlet_patch):
+    """ExtractBlock + IntegrateVariables pipeline over one patch of the reader output."""
+    from paraview.simple import ExtractBlock, IntegrateVariables
+
+    key = (_reader_key(case_reader), outlet_patch)
+    if key not in _outlet_pipelines:
+        # Region names look like 'patch/outlet'; '//outlet' matches it at any depth
+        extract = ExtractBlock(Input=case_reader, Selectors=[f"//{outlet_patch}"])
+        integ = IntegrateVariables(Input=extract)
+        # Cell data comes out area-averaged instead of area-integrated
+        integ.DivideCellDataByVolume = 1
+        _outlet_pipelines[key] = (integ, extract)
+    return _outlet_pipelines[key][0]
+
+
 def get_combustion_efficiency(case_reader, case_dir):
     """
     Compute: η_c = 1 - (CH4_outlet / CH4_inlet)
@@ -116,115 +350,185 @@ def get_combustion_efficiency(case_reader, case_dir):
     Uses outlet patch directly to measure fuel conversion.
     This correctly measures fuel conversion for a flow-through combustor.
     """
+    from paraview import servermanager
+    from paraview.vtk.numpy_interface import dataset_adapter as dsa
+
     # Read inlet CH4 mass fraction from boundary conditions
     inlet_conditions = get_inlet_conditions(case_dir)
     ch4_inlet = inlet_conditions["CH4_inlet"]
 
-    # Extract outlet patch directly from multi-block dataset
-    # ParaView loads patches as separate blocks
-    case_reader.UpdatePipeline()
-
-    # Get available blocks (convert to list)
-    blocks_property = case_reader.GetPropertyValue("MeshRegions")
-    blocks = list(blocks_property)  # Convert to regular Python list
+    # Resolve the outlet patch from the loaded mesh regions
+    blocks = list(case_reader.GetPropertyValue("MeshRegions"))
 
     outlet_block_name = None
-    outlet_block_index = None
-    for i, block in enumerate(blocks):
+    for block in blocks:
         if 'outlet' in block.lower():
             outlet_block_name = block
-            outlet_block_index = i
             break
 
     if outlet_block_name is None:
         raise ValueError(f"Outlet patch not found. Available blocks: {blocks}")
 
-    # Fetch the entire multi-block dataset from the case reader
-    # OpenFOAM reader returns: [internalMesh, boundary[patches...]]
-    full_data = servermanager.Fetch(case_reader)
+    # Extract and integrate the outlet patch server-side so only the
+    # 1-cell integrated result is fetched (not every patch of the dataset)
+    integ = _outlet_pipeline(case_reader, outlet_block_name.split('/')[-1])
+    integ.UpdatePipeline()
+    integrated_data = dsa.WrapDataObject(servermanager.Fetch(integ))
 
-    # Find outlet patch in the hierarchical structure
-    # Structure: Block 0 = internalMesh, Block 1 = boundary (contains patches)
-    outlet_block = None
-    for i in range(full_data.GetNumberOfBlocks()):
-        block = full_data.GetBlock(i)
-        block_name = full_data.GetMetaData(i).Get(vtk.vtkCompositeDataSet.NAME()) if full_data.GetMetaData(i) else "unnamed"
+    # Get area-averaged CH4 from integrated data (cell data first, then point data)
+    cell_arrays = integrated_data.CellData.keys()
+    point_arrays = integrated_data.PointData.keys()
 
-        if outlet_block_name.lower() in block_name.lower():
-            outlet_block = block
-            break
+    if 'Area' not in cell_arrays:
+        raise ValueError("IntegrateVariables failed to compute Area")
+
+    area = integrated_data.CellData['Area'][0]
+    if area <= 0:
+        raise ValueError(f"Invalid outlet area: {area}")
 
-        # Check sub-blocks (patches are in "boundary" block)
-        if hasattr(block, 'GetNumberOfBlocks'):
-            for j in range(block.GetNumberOfBlocks()):
-                sub_block = block.GetBlock(j)
-                sub_name = block.GetMetaData(j).Get(vtk.vtkCompositeDataSet.NAME()) if block.GetMetaData(j) else "unnamed"
-                if 'outlet' in sub_name.lower():
-                    outlet_block = sub_block
-                    break
-            if outlet_block:
-                break
-
-    if outlet_block is None:
-        raise ValueError(f"Could not find outlet block in fetched data structure")
-
-    # Get CH4 array from outlet patch (try cell data first, then point data)
-    cell_data = outlet_block.GetCellData()
-    point_data = outlet_block.GetPointData()
-
-    ch4_array = cell_data.GetArray('CH4')
-    if ch4_array is None:
-        ch4_array = point_data.GetArray('CH4')
-
-    if ch4_array is None:
-        cell_arrays = [cell_data.GetArrayName(i) for i in range(cell_data.GetNumberOfArrays())]
-        point_arrays = [point_data.GetArrayName(i) for i in range(point_data.GetNumberOfArrays())]
+    if 'CH4' in cell_arrays:
+        # Already divided by the area server-side
+        ch4_outlet = integrated_data.CellData['CH4'][0]
+    elif 'CH4' in point_arrays:
+        # Point data is never divided by IntegrateVariables
+        ch4_outlet = integrated_data.PointData['CH4'][0] / area
+    else:
         raise ValueError(f"CH4 array not found at outlet. Cell arrays: {cell_arrays}, Point arrays: {point_arrays}")
 
-    # Use VTK's IntegrateAttributes to compute area-weighted average
-    # This properly integrates fields over the surface accounting for cell areas
-    integrate = vtk.vtkIntegrateAttributes()
-    integrate.SetInputData(outlet_block)
-    integrate.Update()
-    integrated_data = integrate.GetOutput()
+    # Efficiency based on outlet
+    efficiency = 1.0 - (ch4_outlet / ch4_inlet)
 
-    # Get integrated CH4 and area from integrated data
-    integrated_cell_data = integrated_data.GetCellData()
-    integrated_point_data = integrated_data.GetPointData()
+    return efficiency
 
-    ch4_integrated_array = integrated_cell_data.GetArray('CH4')
-    if ch4_integrated_array is None:
-        ch4_integrated_array = integrated_point_data.GetArray('CH4')
 
-    if ch4_integrated_array is None:
-        raise ValueError("vtkIntegrateAttributes failed to integrate CH4")
+# REMOVED: get_pressure_loss function
+# Pressure metrics have been moved to get_metric.sh for faster log-based extraction
+# This avoids the need to load the entire case in ParaView just for pressure values
 
-    area_array = integrated_cell_data.GetArray('Area')
-    if area_array is None:
-        area_array = integrated_point_data.GetArray('Area')
 
-    if area_array is None:
-        raise ValueError("vtkIntegrateAttributes failed to compute Area")
+# Volume integrals are shared by ch4_domain_average, pattern_factor and
+# temperature_rise; keyed by _reader_key so all metrics requested in one
+# run reuse a single IntegrateVariables pass (see _volume_integrate).
+_volume_integrals = {}
 
-    # Extract scalar values
-    ch4_integrated = ch4_integrated_array.GetValue(0)
-    area = area_array.GetValue(0)
+# Volume integration pipelines, built once per reader and re-executed
+# whenever the reader moves to another time step; each entry is the
+# IntegrateVariables filter (deleted by release_reader()) and the
+# unregistered MAX reduction helper (freed with the entry)
+_volume_pipelines = {}
 
-    if area <= 0:
-        raise ValueError(f"Invalid outlet area: {area}")
 
-    # Compute area-averaged CH4 at outlet
-    ch4_outlet = ch4_integrated / area
+def _volume_pipeline(case_reader):
+    """
+    IntegrateVariables filter on the reader output, and a MinMax(MAX) helper
+    for fetching the reader output reduced to its maxima.
+    """
+    from paraview import servermanager
+    from paraview.simple import IntegrateVariables
 
-    # Efficiency based on outlet
-    efficiency = 1.0 - (ch4_outlet / ch4_inlet)
+    key = _reader_key(case_reader)
+    if key not in _volume_pipelines:
+        integ = IntegrateVariables(Input=case_reader)
+        # Not connected to any input: Fetch() runs it on every rank's piece
+        # and again on the gathered per-rank results
+        max_helper = servermanager.filters.MinMax()
+        max_helper.Operation = 'MAX'
+        _volume_pipelines[key] = (integ, max_helper)
+    return _volume_pipelines[key]
 
-    return efficiency
 
+def _volume_integrate(case_reader):
+    """
+    Integrate cell fields over the internal mesh volume in a single pipeline pass,
+    and fetch the maximum temperature along with it.
 
-# REMOVED: get_pressure_loss function
-# Pressure metrics have been moved to get_metric.sh for faster log-based extraction
-# This avoids the need to load the entire case in ParaView just for pressure values
+    The result is cached per reader, so computing several volume metrics on the
+    same case only traverses the cells and fetches from the server once per time.
+    Call _invalidate_volume_integrals() after moving the reader to another time.
+
+    Args:
+        case_reader: ParaView case reader
+
+    Returns:
+        dict mapping integrated cell array names (e.g. 'T', 'CH4') plus
+        'Volume' and 'T_max' to scalar values
+    """
+    from paraview import servermanager
+    from paraview.vtk.numpy_interface import algorithms as algs
+    from paraview.vtk.numpy_interface import dataset_adapter as dsa
+
+    key = _reader_key(case_reader)
+    if key in _volume_integrals:
+        return _volume_integrals[key]
+
+    integ, max_helper = _volume_pipeline(case_reader)
+    integ.UpdatePipeline()
+
+    # Fetched separately: IntegrateVariables already reduces its result to a
+    # single cell on rank 0, and the maxima go through the MAX reduction
+    # (a grouped fetch would come back as one block per rank under MPI)
+    cell_data = dsa.WrapDataObject(servermanager.Fetch(integ)).CellData
+    max_data = dsa.WrapDataObject(servermanager.Fetch(case_reader, max_helper, max_helper)).CellData
+
+    # Keep scalar integrals only (vector fields such as U are skipped)
+    integrals = {}
+    for name in cell_data.keys():
+        array = cell_data[name]
+        if array.ndim == 1:
+            integrals[name] = array[0]
+
+    if "Volume" not in integrals:
+        raise ValueError("Volume array not found in integrated data")
+    if integrals["Volume"] <= 0:
+        raise ValueError(f"Invalid volume: {integrals['Volume']}")
+
+    if 'T' in max_data.keys():
+        # A single value after the reduction; max() also covers a composite result
+        integrals["T_max"] = algs.max(max_data['T'])
+
+    _volume_integrals[key] = integrals
+    return integrals
+
+
+def _invalidate_volume_integrals():
+    """Drop cached volume integrals (e.g. after changing the reader time)."""
+    _volume_integrals.clear()
+
+
+def release_reader(case_reader):
+    """
+    Delete a reader together with the pipelines built on it.
+
+    Long-lived callers (compute_metric_server.py) use this when they drop a
+    reader, so its mesh and the cached filter proxies are freed.
+    """
+    from paraview.simple import Delete
+
+    key = _reader_key(case_reader)
+    _volume_integrals.pop(key, None)
+    volume_pipeline = _volume_pipelines.pop(key, None)
+    if volume_pipeline is not None:
+        Delete(volume_pipeline[0])
+    for outlet_key in [k for k in _outlet_pipelines if k[0] == key]:
+        for proxy in _outlet_pipelines.pop(outlet_key):
+            Delete(proxy)
+    Delete(case_reader)
+
+
+def _volume_average(case_reader, field_name):
+    """Volume-averaged value of a cell field, from the shared integration pass."""
+    integrals = _volume_integrate(case_reader)
+    if field_name not in integrals:
+        raise ValueError(f"{field_name} array not found in integrated data")
+    return integrals[field_name] / integrals["Volume"]
+
+
+def _temperature_max(case_reader):
+    """Maximum cell temperature, from the shared integration pass."""
+    integrals = _volume_integrate(case_reader)
+    if "T_max" not in integrals:
+        raise ValueError("Temperature array 'T' not found in MinMax output")
+    return integrals["T_max"]
 
 
 def get_ch4_domain_average(case_reader, case_dir):
@@ -246,30 +550,8 @@ def get_ch4_domain_average(case_reader, case_dir):
     Returns:
         Volume-averaged CH4 mass fraction (0-1)
     """
-    # Integrate CH4 over entire internal mesh volume
-    integ = IntegrateVariables(Input=case_reader)
-    integ.UpdatePipeline()
-
-    data = servermanager.Fetch(integ)
-    cell_data = data.GetCellData()
-
-    # Get CH4 integrated value
-    ch4_array = cell_data.GetArray('CH4')
-    if ch4_array is None:
-        raise ValueError("CH4 array not found in integrated data")
-    ch4_integrated = ch4_array.GetValue(0)
-
-    # Get volume
-    vol_array = cell_data.GetArray('Volume')
-    if vol_array is None:
-        raise ValueError("Volume array not found in integrated data")
-    volume = vol_array.GetValue(0)
-
-    # Compute volume-averaged CH4
-    if volume <= 0:
-        raise ValueError(f"Invalid volume: {volume}")
-
-    ch4_avg = ch4_integrated / volume
+    # Volume-averaged CH4 over the internal mesh (shared integration pass)
+    ch4_avg = _volume_average(case_reader, 'CH4')
 
     return ch4_avg
 
@@ -284,42 +566,9 @@ def get_pattern_factor(case_reader, case_dir):
         case_reader: ParaView case reader
         case_dir: Path to case directory (for reading BCs)
     """
-    # Get T_max from field range
-    case_reader.UpdatePipeline()
-    data_info = case_reader.GetDataInformation()
-    cell_data_info = data_info.GetCellDataInformation()
-    T_array_info = cell_data_info.GetArrayInformation('T')
-
-    if T_array_info is None:
-        raise ValueError("Temperature array 'T' not found in cell data information")
-
-    T_range = T_array_info.GetComponentRange(0)
-    T_max = T_range[1]
-
-    # Integrate T over volume
-    integ = IntegrateVariables(Input=case_reader)
-    integ.UpdatePipeline()
-
-    data = servermanager.Fetch(integ)
-    cell_data = data.GetCellData()
-
-    # Get T integrated value
-    T_array = cell_data.GetArray('T')
-    if T_array is None:
-        raise ValueError("Temperature array 'T' not found in integrated data")
-    T_integrated = T_array.GetValue(0)
-
-    # Get volume
-    vol_array = cell_data.GetArray('Volume')
-    if vol_array is None:
-        raise ValueError("Volume array not found in integrated data")
-    volume = vol_array.GetValue(0)
-
-    # Compute average
-    if volume <= 0:
-        raise ValueError(f"Invalid volume: {volume}")
-
-    T_avg = T_integrated / volume
+    # T_max and volume-averaged T from the shared integration pass
+    T_max = _temperature_max(case_reader)
+    T_avg = _volume_average(case_reader, 'T')
 
     # Read inlet temperature from boundary conditions
     inlet_conditions = get_inlet_conditions(case_dir)
@@ -347,42 +596,9 @@ def get_temperature_rise_efficiency(case_reader, case_dir):
         case_reader: ParaView case reader
         case_dir: Path to case directory (for reading BCs)
     """
-    # Get T_max from field range
-    case_reader.UpdatePipeline()
-    data_info = case_reader.GetDataInformation()
-    cell_data_info = data_info.GetCellDataInformation()
-    T_array_info = cell_data_info.GetArrayInformation('T')
-
-    if T_array_info is None:
-        raise ValueError("Temperature array 'T' not found in cell data information")
-
-    T_range = T_array_info.GetComponentRange(0)
-    T_max = T_range[1]
-
-    # Integrate T over volume
-    integ = IntegrateVariables(Input=case_reader)
-    integ.UpdatePipeline()
-
-    data = servermanager.Fetch(integ)
-    cell_data = data.GetCellData()
-
-    # Get T integrated value
-    T_array = cell_data.GetArray('T')
-    if T_array is None:
-        raise ValueError("Temperature array 'T' not found in integrated data")
-    T_integrated = T_array.GetValue(0)
-
-    # Get volume
-    vol_array = cell_data.GetArray('Volume')
-    if vol_array is None:
-        raise ValueError("Volume array not found in integrated data")
-    volume = vol_array.GetValue(0)
-
-    # Compute average
-    if volume <= 0:
-        raise ValueError(f"Invalid volume: {volume}")
-
-    T_avg = T_integrated / volume
+    # T_max and volume-averaged T from the shared integration pass
+    T_max = _temperature_max(case_reader)
+    T_avg = _volume_average(case_reader, 'T')
 
     # Read inlet temperature from boundary conditions
     inlet_conditions = get_inlet_conditions(case_dir)
@@ -399,91 +615,236 @@ def get_temperature_rise_efficiency(case_reader, case_dir):
     return eta_T
 
 
+METRICS = {
+    'combustion_efficiency': get_combustion_efficiency,
+    'ch4_domain_average': get_ch4_domain_average,
+    'pattern_factor': get_pattern_factor,
+    'temperature_rise': get_temperature_rise_efficiency,
+}
+
+
+def open_case(case_dir, foam_file=None):
+    """
+    Create an OpenFOAM reader for a serial or decomposed case.
+
+    Args:
+        case_dir: Path to case directory
+        foam_file: Existing .foam file for serial cases (default: case_dir/case.foam,
+                   created if missing)
+
+    Returns:
+        ParaView OpenFOAMReader proxy
+    """
+    from paraview.simple import OpenFOAMReader
+
+    # Check if it's a decomposed case (has processor* dirs)
+    processor_dirs = list(case_dir.glob("processor*"))
+    if processor_dirs:
+        # Decomposed case - use case directory directly
+        case_reader = OpenFOAMReader(FileName=str(case_dir))
+        case_reader.CaseType = 'Decomposed Case'
+    else:
+        # Serial/reconstructed case - create .foam file if needed
+        # (a single stat in the usual case where it already exists)
+        if foam_file is None:
+            foam_file = case_dir / "case.foam"
+            try:
+                os.stat(foam_file)
+            except FileNotFoundError:
+                foam_file.touch()
+        case_reader = OpenFOAMReader(FileName=str(foam_file))
+
+    return case_reader
+
+
+def mpi_command(case_dir):
+    """
+    Command re-running this script with pvbatch under mpiexec, so each rank
+    reads its own processor* directories of a decomposed case.
+
+    Opt-in: only used when COMPUTE_METRIC_NPROCS asks for more than one
+    rank, since metric calls usually run next to the solvers of other trials
+    and compute_metric_server.py always reads cases serially. Serial cases
+    (no processor* directories) are never re-launched.
+
+    Returns:
+        Argument list, or None to run in the current (single-rank) process
+    """
+    # Already running under MPI (or re-launched by us)
+    if any(var in os.environ for var in ("COMPUTE_METRIC_MPI_CHILD", "OMPI_COMM_WORLD_SIZE", "PMI_SIZE")):
+        return None
+
+    nprocs = int(os.environ.get("COMPUTE_METRIC_NPROCS", "1"))
+    if nprocs <= 1:
+        return None
+
+    # Serial cases are read by a single rank, whatever COMPUTE_METRIC_NPROCS says
+    if not any(case_dir.glob("processor*")):
+        return None
+
+    mpiexec = shutil.which("mpiexec")
+    pvbatch = shutil.which("pvbatch")
+    if mpiexec is None or pvbatch is None:
+        return None
+
+    return [mpiexec, "-n", str(nprocs), pvbatch, os.path.abspath(__file__)] + sys.argv[1:]
+
+
+def validate_metric_names(metric_names):
+    """Raise ValueError for metric names missing from METRICS."""
+    for metric_name in metric_names:
+        if metric_name not in METRICS:
+            raise ValueError(f"Unknown metric: {metric_name}. Available: {list(METRICS.keys())}")
+
+
+def prepare_reader(case_reader, metric_names):
+    """
+    Configure the reader for the requested metrics and refresh its time steps.
+
+    Args:
+        case_reader: ParaView case reader from open_case()
+        metric_names: List of metric names (keys of METRICS)
+
+    Returns:
+        Available time values
+    """
+    validate_metric_names(metric_names)
+
+    # Load only the mesh regions the requested metrics need
+    # (the outlet patch is only loaded for combustion_efficiency)
+    regions = []
+    for metric_name in metric_names:
+        regions += [r for r in METRIC_REGIONS[metric_name] if r not in regions]
+    case_reader.MeshRegions = regions
+
+    # Force refresh of pipeline information to get all time steps
+    case_reader.UpdatePipelineInformation()
+
+    # Enable only the cell arrays the requested metrics need
+    fields = {field for metric_name in metric_names for field in METRIC_FIELDS[metric_name]}
+    case_reader.CellArrays = sorted(fields)
+
+    # Get time steps
+    time_values = case_reader.TimestepValues
+    if not time_values:
+        raise ValueError("No time steps found in case")
+
+    return time_values
+
+
+def select_time(time_values, requested_time=None):
+    """
+    Pick the available time closest to requested_time (default: latest).
+    """
+    if requested_time is None:
+        # Default: use latest time
+        return time_values[-1]
+
+    # Find closest available time to requested time (time values are sorted)
+    times = np.asarray(time_values, dtype=np.float64)
+    idx = np.searchsorted(times, requested_time)
+    candidates = times[max(0, idx - 1):idx + 1]
+    closest_time = candidates[np.abs(candidates - requested_time).argmin()]
+
+    if abs(closest_time - requested_time) > 1e-6:
+        print(f"Warning: Requested time {requested_time} not available. Using closest time {closest_time}", file=sys.stderr)
+
+    return closest_time
+
+
+def evaluate_metrics(case_reader, case_dir, metric_names, use_time):
+    """
+    Move a prepared reader to use_time and compute the requested metrics.
+
+    Returns:
+        List of metric values, in the order of metric_names
+    """
+    # Update to selected time step; cached integrals belong to the previous one
+    case_reader.UpdatePipeline(time=use_time)
+    _invalidate_volume_integrals()
+
+    # Compute metrics (pass case_dir for reading boundary conditions)
+    # Volume metrics share one cached integration pass on the reader
+    return [METRICS[metric_name](case_reader, case_dir) for metric_name in metric_names]
+
+
+def compute_metrics(case_reader, case_dir, metric_names, requested_time=None):
+    """
+    Configure the reader for the requested metrics and compute them.
+
+    The reader may be reused across calls (e.g. by compute_metric_server.py);
+    mesh regions, cell arrays and time steps are refreshed every time.
+
+    Args:
+        case_reader: ParaView case reader from open_case()
+        case_dir: Path to case directory (for reading BCs)
+        metric_names: List of metric names (keys of METRICS)
+        requested_time: Time to evaluate at (default: latest)
+
+    Returns:
+        List of metric values, in the order of metric_names
+    """
+    time_values = prepare_reader(case_reader, metric_names)
+    use_time = select_time(time_values, requested_time)
+    return evaluate_metrics(case_reader, case_dir, metric_names, use_time)
+
+
 def main():
     """Main entry point."""
     try:
-        # Compute requested metric
-        metrics = {
-            'combustion_efficiency': get_combustion_efficiency,
-            'ch4_domain_average': get_ch4_domain_average,
-            'pattern_factor': get_pattern_factor,
-            'temperature_rise': get_temperature_rise_efficiency,
-        }
-
-        if len(sys.argv) < 3 or len(sys.argv) > 4:
-            print(f"Usage: pvpython compute_metric.py <case_dir> <metric_name> [--time TIME]", file=sys.stderr)
-            print(f"Available metrics: {list(metrics.keys())}", file=sys.stderr)
-            print(f"Optional: --time TIME (default: latest)", file=sys.stderr)
+        if len(sys.argv) < 3 or len(sys.argv) > 5:
+            print("Usage: pvpython compute_metric.py <case_dir> <metric_name>[,<metric_name>...] [--time=TIME | --times=T0,T1,...] [--foam-file=PATH]", file=sys.stderr)
+            print(f"Available metrics: {list(METRICS.keys())}", file=sys.stderr)
+            print("Optional: --time=TIME (default: latest), --times=T0,T1,... (one output line per time)", file=sys.stderr)
+            print("Optional: --foam-file=PATH (existing .foam file, skips the case.foam probe)", file=sys.stderr)
             sys.exit(1)
 
         case_dir = Path(sys.argv[1])
-        metric_name = sys.argv[2]
+        metric_names = sys.argv[2].split(',')
 
-        # Parse optional time argument
+        # Parse optional arguments
         requested_time = None
-        if len(sys.argv) == 4:
-            time_arg = sys.argv[3]
-            if time_arg.startswith('--time='):
-                requested_time = float(time_arg.split('=')[1])
+        requested_times = None
+        foam_file = None
+        for option in sys.argv[3:]:
+            if option.startswith('--time='):
+                requested_time = float(option.split('=')[1])
+            elif option.startswith('--times='):
+                requested_times = [float(t) for t in option.split('=')[1].split(',')]
+            elif option.startswith('--foam-file='):
+                foam_file = Path(option.split('=', 1)[1])
             else:
                 sys.exit(1)
 
         if not case_dir.exists():
             raise FileNotFoundError(f"Case directory does not exist: {case_dir}")
 
-        if metric_name not in metrics:
-            raise ValueError(f"Unknown metric: {metric_name}. Available: {list(metrics.keys())}")
-
-        # Check if it's a decomposed case (has processor* dirs)
-        processor_dirs = list(case_dir.glob("processor*"))
-        if processor_dirs:
-            # Decomposed case - use case directory directly
-            case_reader = OpenFOAMReader(FileName=str(case_dir))
-            case_reader.CaseType = 'Decomposed Case'
-        else:
-            # Serial/reconstructed case - create .foam file if needed
-            foam_file = case_dir / "case.foam"
-            if not foam_file.exists():
-                foam_file.touch()
-            case_reader = OpenFOAMReader(FileName=str(foam_file))
-
-        # Load internal mesh and boundary patches
-        # Make sure to load outlet patch for efficiency calculation
-        case_reader.MeshRegions = ['internalMesh', 'patch/inletAir', 'patch/inletFuel', 'patch/outlet']
-
-        # Force refresh of pipeline information to get all time steps
-        case_reader.UpdatePipelineInformation()
-
-        # Enable ALL available cell arrays
-        case_reader.CellArrays = case_reader.CellArrays.Available
+        # Validate before open_case() loads ParaView
+        validate_metric_names(metric_names)
 
-        # Get time steps
-        time_values = case_reader.TimestepValues
-        if not time_values:
-            raise ValueError("No time steps found in case")
+        # With COMPUTE_METRIC_NPROCS>1, decomposed cases are read in parallel by
+        # pvbatch ranks; pvbatch runs this script on rank 0 only, so output is printed once
+        command = mpi_command(case_dir)
+        if command is not None:
+            env = dict(os.environ, COMPUTE_METRIC_MPI_CHILD="1")
+            sys.exit(subprocess.call(command, env=env))
 
-        # Determine which time to use
-        if requested_time is not None:
-            # Find closest available time to requested time
-            available_times = list(time_values)
-            closest_time = min(available_times, key=lambda t: abs(t - requested_time))
-
-            if abs(closest_time - requested_time) > 1e-6:
-                print(f"Warning: Requested time {requested_time} not available. Using closest time {closest_time}", file=sys.stderr)
-
-            use_time = closest_time
-        else:
-            # Default: use latest time
-            use_time = time_values[-1]
+        case_reader = open_case(case_dir, foam_file)
 
-        # Update to selected time step
-        case_reader.UpdatePipeline(time=use_time)
+        if requested_times is not None:
+            # Load the case once and step the same reader/pipelines through time
+            time_values = prepare_reader(case_reader, metric_names)
+            for requested in requested_times:
+                use_time = select_time(time_values, requested)
+                values = evaluate_metrics(case_reader, case_dir, metric_names, use_time)
+                print(" ".join(f"{value}" for value in [use_time] + values))
+            return
 
-        # Compute metric (pass case_dir for reading boundary conditions)
-        value = metrics[metric_name](case_reader, case_dir)
+        values = compute_metrics(case_reader, case_dir, metric_names, requested_time)
 
-        # Output result
-        print(f"{value}")
+        # Output results, one per line
+        for value in values:
+            print(f"{value}")
 
     except Exception as e:
         print(f"Error computing metric: {e}", file=sys.stderr)
@@ -0,0 +1,141 @@
+#!/usr/bin/env pvpython
+"""
+Long-lived driver for compute_metric.py.
+
+Keeps ParaView imported and OpenFOAM readers open between requests, so the
+import and reader construction cost is paid once instead of once per metric.
+
+Usage:
+    pvpython compute_metric_server.py                 # requests on stdin
+    pvpython compute_metric_server.py --socket PATH   # requests on a UNIX socket
+
+Request format (one per line, tab-separated):
+    <case_dir> <TAB> <metric_name>[,<metric_name>...] [<TAB> <time>]
+
+Replies with one line per request holding the tab-separated metric values,
+or "nan" for each requested metric if the computation failed (the error
+is reported on stderr).
+
+get_metric.sh forwards field-based metrics to the socket at
+$METRIC_SERVER_SOCKET (default: /tmp/data/metric_server.sock) when it exists.
+"""
+
+import os
+import socketserver
+import sys
+import traceback
+from collections import OrderedDict
+from pathlib import Path
+
+from compute_metric import compute_metrics, open_case, release_reader
+
+# Readers kept open at once; every trial is a new case directory, so the
+# least recently used reader is released (with its pipelines) beyond this
+MAX_READERS = 8
+
+# Resolved case directory -> (case_signature, reader), least recently used first
+_readers = OrderedDict()
+
+
+def case_signature(case_dir):
+    """
+    Identity of a case directory's current contents.
+
+    Regenerating the case at the same path (new directory, or entries such
+    as time or processor directories added/removed) changes it.
+    """
+    stat = os.stat(case_dir)
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def get_reader(case_dir):
+    """
+    OpenFOAM reader for a resolved case directory, reused across requests
+    as long as the directory is not regenerated (see case_signature).
+    """
+    signature = case_signature(case_dir)
+    cached = _readers.pop(case_dir, None)
+    if cached is not None:
+        if cached[0] == signature:
+            _readers[case_dir] = cached
+            return cached[1]
+        release_reader(cached[1])
+
+    reader = open_case(Path(case_dir))
+    # Taken again: open_case() may have just created case.foam
+    _readers[case_dir] = (case_signature(case_dir), reader)
+    while len(_readers) > MAX_READERS:
+        _, (_, evicted) = _readers.popitem(last=False)
+        release_reader(evicted)
+    return reader
+
+
+def handle_request(line):
+    """
+    Compute the metrics for one request line.
+
+    Returns:
+        Reply line (without newline)
+    """
+    fields = line.rstrip("\n").split("\t")
+    metric_names = fields[1].split(",") if len(fields) > 1 else []
+    try:
+        if len(fields) not in (2, 3):
+            raise ValueError(f"Malformed request: {line!r}")
+
+        case_dir = Path(fields[0]).resolve()
+        requested_time = float(fields[2]) if len(fields) == 3 and fields[2] else None
+
+        if not case_dir.exists():
+            raise FileNotFoundError(f"Case directory does not exist: {case_dir}")
+
+        values = compute_metrics(get_reader(str(case_dir)), case_dir, metric_names, requested_time)
+        return "\t".join(f"{value}" for value in values)
+
+    except Exception as e:
+        print(f"Error computing metric: {e}", file=sys.stderr)
+        traceback.print_exc(file=sys.stderr)
+        return "\t".join(["nan"] * max(len(metric_names), 1))
+
+
+class MetricRequestHandler(socketserver.StreamRequestHandler):
+    """Serve one request line per connection."""
+
+    def handle(self):
+        line = self.rfile.readline().decode()
+        if line.strip():
+            self.wfile.write((handle_request(line) + "\n").encode())
+
+
+def serve_stdin():
+    """Answer requests from stdin until EOF."""
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        print(handle_request(line), flush=True)
+
+
+def serve_socket(socket_path):
+    """Answer requests on a UNIX socket, one at a time (ParaView is not thread-safe)."""
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    with socketserver.UnixStreamServer(socket_path, MetricRequestHandler) as server:
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+def main():
+    """Main entry point."""
+    if len(sys.argv) == 3 and sys.argv[1] == "--socket":
+        serve_socket(sys.argv[2])
+    elif len(sys.argv) == 1:
+        serve_stdin()
+    else:
+        print("Usage: pvpython compute_metric_server.py [--socket PATH]", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,170 @@ import argparse
 import base64
 import io
 import sys
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def load_geometry_dict(path):
+    """Parse a geometryDict once per path into a plain nested dict"""
+    from foamlib import FoamFile
+    return FoamFile(path).as_dict()
+
+def channel_points(cfg):
+    """
+    Wire points of the channel and blunt bodies as a (16, 2) array; row i
+    is channel(i+1). Rows 0-7 outline the channel, 8-11 the front blunt
+    body and 12-15 the (unrotated) rear blunt body.
+    """
+    import numpy as np
+
+    bevel_pos = cfg["channel"]["bevel"]["position"]
+    bevel_theta = cfg["channel"]["bevel"]["angle"]
+    inlet_width = cfg["channel"]["inletWidth"]
+    out_width = cfg["channel"]["outletWidth"] if bevel_theta >= 1 else inlet_width
+    bevel_width = (inlet_width - out_width) / 2.0 if bevel_theta >= 1 else 0
+    bevel_end = bevel_pos + bevel_width / math.tan(math.radians(bevel_theta)) if bevel_theta >= 1 else bevel_pos
+    length = cfg["channel"]["length"]
+    front_length = cfg["frontBluntBody"]["length"]
+    front_width = cfg["frontBluntBody"]["width"]
+    front_top = inlet_width - (inlet_width - front_width) / 2.0
+    rear_cfg = cfg["rearBluntBody"]
+    rear_x = rear_cfg["positionX"]
+    rear_y = (inlet_width - rear_cfg["width"]) / 2.0
+
+    return np.array([
+        # Channel outline
+        (0, 0),
+        (bevel_pos, 0),
+        (bevel_end, bevel_width),
+        (length, bevel_width),
+        (length, bevel_width + out_width),
+        (bevel_end, bevel_width + out_width),
+        (bevel_pos, inlet_width),
+        (0, inlet_width),
+        # Front blunt body
+        (0, front_top),
+        (front_length, front_top),
+        (front_length, front_top - front_width),
+        (0, front_top - front_width),
+        # Rear blunt body
+        (rear_x, rear_y),
+        (rear_x + rear_cfg["length"], rear_y),
+        (rear_x + rear_cfg["length"], rear_y + rear_cfg["width"]),
+        (rear_x, rear_y + rear_cfg["width"]),
+    ], dtype=float)
+
+def vane_leg_points(vane_cfg):
+    """
+    Vane leg points relative to the vane center as a (5, 2) array: three
+    points for leg 1, then two for leg 2. Shared by the 2D preview and the
+    3D vane sections so the leg trigonometry lives in one place.
+    """
+    import numpy as np
+
+    thickness = vane_cfg["thickness"]
+    l1 = vane_cfg["L1"]
+    l2 = vane_cfg["L2"]
+    angle1_rad = math.radians(vane_cfg["angleLeg1"])
+    angle2_rad = math.radians(vane_cfg["angleLeg2"])
+
+    # Apply 2D rotation around Z axis (matches madcad rotatearound)
+    # For vec3(x, y, 0) rotated by θ around Z: (x*cos(θ) - y*sin(θ), x*sin(θ) + y*cos(θ))
+    cos1, sin1 = math.cos(angle1_rad), math.sin(angle1_rad)
+    cos2, sin2 = math.cos(angle2_rad), math.sin(angle2_rad)
+    r1 = np.array([[cos1, -sin1], [sin1, cos1]])
+    r2 = np.array([[cos2, -sin2], [sin2, cos2]])
+
+    # Leg 1: [O, r1*vec3(0,l1,0), r1*vec3(thickness,l1,0)]
+    leg1 = np.array([(0, 0), (0, l1), (thickness, l1)])
+    # Leg 2: [r2*vec3(l2,thickness,0), r2*vec3(l2,0,0)]
+    leg2 = np.array([(l2, thickness), (l2, 0)])
+
+    return np.vstack([leg1 @ r1.T, leg2 @ r2.T])
+
+class GeometryPreview:
+    """
+    Matplotlib figure for the 2D geometry illustration.
+
+    The figure, axes, collections and legend are built once; render() only
+    swaps the collection geometry and axis limits before saving.
+    """
+
+    # (color, linewidth, label) for channel walls, air inlet, fuel inlet, outlet
+    LINES = [('black', 2, 'Channel walls'), ('blue', 3, 'Air inlet'),
+             ('red', 3, 'Fuel inlet'), ('green', 3, 'Outlet')]
+    # (face color, edge color, label) for front body, rear body, vane 1, vane 2
+    BODIES = [('gray', 'black', 'Front body'), ('lightblue', 'blue', 'Rear body'),
+              ('orange', 'darkorange', 'Vane 1'), ('green', 'darkgreen', 'Vane 2')]
+
+    def __init__(self):
+        from matplotlib.collections import LineCollection, PatchCollection
+        from matplotlib.figure import Figure
+        from matplotlib.lines import Line2D
+        from matplotlib.patches import Patch
+
+        # A bare Figure renders through Agg and stays out of pyplot's figure registry
+        self.fig = Figure(figsize=(8, 3))
+        self.ax = ax = self.fig.subplots()
+
+        # Channel outline plus inlet/outlet markers as one line collection
+        self.lines = LineCollection(
+            [],
+            colors=[color for color, _, _ in self.LINES],
+            linewidths=[lw for _, lw, _ in self.LINES],
+            capstyle='projecting', joinstyle='round',
+        )
+        ax.add_collection(self.lines)
+
+        # Front/rear blunt bodies and vanes as one patch collection
+        self.bodies = PatchCollection(
+            [],
+            facecolors=[face for face, _, _ in self.BODIES],
+            edgecolors=[edge for _, edge, _ in self.BODIES],
+            linewidths=1.5, alpha=0.5,
+        )
+        ax.add_collection(self.bodies)
+
+        # Collections carry no per-item labels, so build the legend from proxies
+        handles = [Line2D([], [], color=color, linewidth=lw, label=label) for color, lw, label in self.LINES[:1]]
+        handles += [Patch(facecolor=face, edgecolor=edge, alpha=0.5, linewidth=1.5, label=label)
+                    for face, edge, label in self.BODIES]
+        handles += [Line2D([], [], color=color, linewidth=lw, label=label) for color, lw, label in self.LINES[1:]]
+
+        # Formatting
+        ax.set_aspect('equal')
+        ax.set_xlabel('X (m)', fontsize=12)
+        ax.set_ylabel('Y (m)', fontsize=12)
+        ax.set_title('AVC Geometry - 2D Cross-section', fontsize=14, fontweight='bold')
+        ax.legend(handles=handles, loc='upper right', fontsize=9)
+        ax.grid(True, alpha=0.3)
+
+        # Fixed margins instead of tight_layout/bbox_inches='tight', which both
+        # need an extra draw pass to measure the artists
+        self.fig.subplots_adjust(left=0.1, right=0.98, bottom=0.15, top=0.9)
+
+    def render(self, pts, vane1_points, vane2_points, length, inlet_width):
+        """Draw the wire points (row i is channel(i+1)) and return PNG bytes"""
+        from matplotlib.patches import Polygon
+
+        self.lines.set_segments([
+            pts[[0, 1, 2, 3, 4, 5, 6, 7, 0]], pts[[7, 8]], pts[[11, 0]], pts[[3, 4]],
+        ])
+        self.bodies.set_paths([
+            Polygon(pts[8:12]), Polygon(pts[12:16]), Polygon(vane1_points), Polygon(vane2_points),
+        ])
+
+        # Set axis limits with some padding
+        self.ax.set_xlim(-0.01, length + 0.01)
+        self.ax.set_ylim(-0.01, inlet_width + 0.01)
+
+        buf = io.BytesIO()
+        self.fig.savefig(buf, format='png', dpi=100)
+        return buf.getvalue()
+
+@lru_cache(maxsize=None)
+def geometry_preview():
+    """Shared GeometryPreview, created on first use"""
+    return GeometryPreview()
 
 def generate_2d_image(parametrization, default_config=None):
     """
@@ -39,20 +203,19 @@ def generate_2d_image(parametrization, default_config=None):
             vane2Leg2Length: 0.015
             vane2Leg2Angle: 180
 
-    default_config is the FoamFile of default case dictionary: AVC/system/geometryDict
+    default_config is the FoamFile (or dict) of default case dictionary;
+    defaults to the cached contents of AVC/system/geometryDict
     """
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    from matplotlib.patches import Polygon
-    import copy
-    from foamlib import FoamFile
+    import numpy as np
 
     # Load default config if not provided
     if default_config is None:
-        default_config = FoamFile("AVC/system/geometryDict")
+        default_config = load_geometry_dict("AVC/system/geometryDict")
 
-    # Merge parametrization into config
-    cfg = copy.deepcopy(default_config)
+    # Merge parametrization into config; only the dicts along overridden
+    # paths are copied, the rest is shared with (and never written to) the defaults
+    cfg = dict(default_config)
+    copied = set()
 
     # Apply parametrization overrides (map from flat names to nested structure)
     param_map = {
@@ -83,146 +246,38 @@ def generate_2d_image(parametrization, default_config=None):
         if param_name in parametrization:
             # Navigate to the nested location and set value
             target = cfg
-            for key in nested_keys[:-1]:
+            for depth, key in enumerate(nested_keys[:-1], 1):
+                if nested_keys[:depth] not in copied:
+                    target[key] = dict(target[key])
+                    copied.add(nested_keys[:depth])
                 target = target[key]
             target[nested_keys[-1]] = parametrization[param_name]
 
     # Build geometry wire points (same logic as generate_geometry())
-    bevel_pos = cfg["channel"]["bevel"]["position"]
-    bevel_theta = cfg["channel"]["bevel"]["angle"]
-    out_width = cfg["channel"]["outletWidth"] if bevel_theta >= 1 else cfg["channel"]["inletWidth"]
-    bevel_width = (cfg["channel"]["inletWidth"] - out_width) / 2.0 if bevel_theta >= 1 else 0
-
-    # Channel outline points
-    channel1 = (0, 0)
-    channel2 = (bevel_pos, 0)
-    channel3 = (bevel_pos + bevel_width / math.tan(math.radians(bevel_theta)) if bevel_theta >= 1 else bevel_pos, bevel_width)
-    channel4 = (cfg["channel"]["length"], channel3[1])
-    channel5 = (channel4[0], channel4[1] + out_width)
-    channel6 = (channel3[0], channel3[1] + out_width)
-    channel7 = (channel2[0], cfg["channel"]["inletWidth"])
-    channel8 = (channel1[0], cfg["channel"]["inletWidth"])
-    channel9 = (channel8[0], channel8[1] - (cfg["channel"]["inletWidth"] - cfg["frontBluntBody"]["width"]) / 2.0)
-    channel10 = (channel9[0] + cfg["frontBluntBody"]["length"], channel9[1])
-    channel11 = (channel10[0], channel10[1] - cfg["frontBluntBody"]["width"])
-    channel12 = (channel11[0] - cfg["frontBluntBody"]["length"], channel11[1])
-
-    # Rear blunt body points
-    rear_blunt_body_posY = (cfg["channel"]["inletWidth"] - cfg["rearBluntBody"]["width"]) / 2.0
-    channel13 = (cfg["rearBluntBody"]["positionX"], rear_blunt_body_posY)
-    channel14 = (channel13[0] + cfg["rearBluntBody"]["length"], channel13[1])
-    channel15 = (channel14[0], channel14[1] + cfg["rearBluntBody"]["width"])
-    channel16 = (channel13[0], channel13[1] + cfg["rearBluntBody"]["width"])
+    pts = channel_points(cfg)
+    rear = pts[12:16]
 
     # Apply rotation to rear body if needed
     rear_angle_rad = math.radians(cfg["rearBluntBody"]["rotationAngle"])
     if abs(rear_angle_rad) > 1e-9:
         # Rotate around center
-        center_x = (channel13[0] + channel14[0] + channel15[0] + channel16[0]) / 4.0
-        center_y = (channel13[1] + channel14[1] + channel15[1] + channel16[1]) / 4.0
-
-        def rotate_point(pt, cx, cy, angle):
-            dx = pt[0] - cx
-            dy = pt[1] - cy
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
-            return (cx + dx * cos_a - dy * sin_a, cy + dx * sin_a + dy * cos_a)
-
-        channel13 = rotate_point(channel13, center_x, center_y, rear_angle_rad)
-        channel14 = rotate_point(channel14, center_x, center_y, rear_angle_rad)
-        channel15 = rotate_point(channel15, center_x, center_y, rear_angle_rad)
-        channel16 = rotate_point(channel16, center_x, center_y, rear_angle_rad)
+        center = rear.mean(axis=0)
+        cos_a, sin_a = math.cos(rear_angle_rad), math.sin(rear_angle_rad)
+        R = np.array([[cos_a, -sin_a], [sin_a, cos_a]])
+        rear[:] = (rear - center) @ R.T + center
 
     # Create vane shapes
     def create_vane_2d(vane_cfg):
-        thickness = vane_cfg["thickness"]
-        l1 = vane_cfg["L1"]
-        l2 = vane_cfg["L2"]
-        angle1_rad = math.radians(vane_cfg["angleLeg1"])
-        angle2_rad = math.radians(vane_cfg["angleLeg2"])
-        cx = vane_cfg["centerX"]
-        cy = vane_cfg["centerY"]
-
-        # Apply 2D rotation around Z axis (matches madcad rotatearound)
-        # For vec3(x, y, 0) rotated by θ around Z: (x*cos(θ) - y*sin(θ), x*sin(θ) + y*cos(θ))
-        cos1, sin1 = math.cos(angle1_rad), math.sin(angle1_rad)
-        cos2, sin2 = math.cos(angle2_rad), math.sin(angle2_rad)
-
-        # Leg 1: [O, r1*vec3(0,l1,0), r1*vec3(thickness,l1,0)]
-        leg1_p1 = (0, 0)
-        leg1_p2 = (0*cos1 - l1*sin1, 0*sin1 + l1*cos1)  # = (-l1*sin1, l1*cos1)
-        leg1_p3 = (thickness*cos1 - l1*sin1, thickness*sin1 + l1*cos1)
-
-        # Leg 2: [r2*vec3(l2,thickness,0), r2*vec3(l2,0,0)]
-        leg2_p1 = (l2*cos2 - thickness*sin2, l2*sin2 + thickness*cos2)
-        leg2_p2 = (l2*cos2 - 0*sin2, l2*sin2 + 0*cos2)  # = (l2*cos2, l2*sin2)
-
         # Create vane polygon (simplified - no filet intersection calculation for 2D)
-        vane_points = [
-            (cx + leg1_p1[0], cy + leg1_p1[1]),
-            (cx + leg1_p2[0], cy + leg1_p2[1]),
-            (cx + leg1_p3[0], cy + leg1_p3[1]),
-            (cx + leg2_p1[0], cy + leg2_p1[1]),
-            (cx + leg2_p2[0], cy + leg2_p2[1]),
-        ]
-        return vane_points
+        return vane_leg_points(vane_cfg) + (vane_cfg["centerX"], vane_cfg["centerY"])
 
     vane1_points = create_vane_2d(cfg["vane1"])
     vane2_points = create_vane_2d(cfg["vane2"])
 
-    # Create matplotlib figure
-    fig, ax = plt.subplots(1, 1, figsize=(12, 6))
-
-    # Plot channel outline
-    channel_outer = [channel1, channel2, channel3, channel4, channel5, channel6, channel7, channel8, channel1]
-    xs, ys = zip(*channel_outer)
-    ax.plot(xs, ys, 'k-', linewidth=2, label='Channel walls')
-
-    # Plot front blunt body
-    front_body = [channel9, channel10, channel11, channel12, channel9]
-    xs, ys = zip(*front_body)
-    ax.fill(xs, ys, color='gray', alpha=0.5, edgecolor='black', linewidth=1.5, label='Front body')
-
-    # Plot rear blunt body
-    rear_body = [channel13, channel14, channel15, channel16, channel13]
-    xs, ys = zip(*rear_body)
-    ax.fill(xs, ys, color='lightblue', alpha=0.5, edgecolor='blue', linewidth=1.5, label='Rear body')
-
-    # Plot vanes
-    vane1_closed = vane1_points + [vane1_points[0]]
-    xs, ys = zip(*vane1_closed)
-    ax.fill(xs, ys, color='orange', alpha=0.5, edgecolor='darkorange', linewidth=1.5, label='Vane 1')
-
-    vane2_closed = vane2_points + [vane2_points[0]]
-    xs, ys = zip(*vane2_closed)
-    ax.fill(xs, ys, color='green', alpha=0.5, edgecolor='darkgreen', linewidth=1.5, label='Vane 2')
-
-    # Mark inlet regions
-    ax.plot([channel8[0], channel9[0]], [channel8[1], channel9[1]], 'b-', linewidth=3, label='Air inlet')
-    ax.plot([channel12[0], channel1[0]], [channel12[1], channel1[1]], 'r-', linewidth=3, label='Fuel inlet')
-
-    # Mark outlet
-    ax.plot([channel4[0], channel5[0]], [channel4[1], channel5[1]], 'g-', linewidth=3, label='Outlet')
-
-    # Formatting
-    ax.set_aspect('equal')
-    ax.set_xlabel('X (m)', fontsize=12)
-    ax.set_ylabel('Y (m)', fontsize=12)
-    ax.set_title('AVC Geometry - 2D Cross-section', fontsize=14, fontweight='bold')
-    ax.legend(loc='upper right', fontsize=9)
-    ax.grid(True, alpha=0.3)
-
-    # Set axis limits with some padding
-    ax.set_xlim(-0.01, cfg["channel"]["length"] + 0.01)
-    ax.set_ylim(-0.01, cfg["channel"]["inletWidth"] + 0.01)
-
-    # Convert to base64
-    buf = io.BytesIO()
-    plt.tight_layout()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    plt.close(fig)
-    buf.seek(0)
-    img_base64 = base64.b64encode(buf.read()).decode('utf-8')
+    # Draw on the shared figure and convert to base64
+    png = geometry_preview().render(pts, vane1_points, vane2_points,
+                                    cfg["channel"]["length"], cfg["channel"]["inletWidth"])
+    img_base64 = base64.b64encode(png).decode('utf-8')
 
     return img_base64
 
@@ -233,7 +288,7 @@ def generate_geometry():
         brick, difference, transform,
         flatsurface, rotatearound, extrusion, union,
         wire, Wire, Segment, web, filet, translate,
-        O, X, Y, Z, vec3
+        X, Y, Z, vec3
     )
     from madcad.boolean import boolean
     from madcad.io import write
@@ -241,22 +296,9 @@ def generate_geometry():
 
     extrude_dir = 2e-3*Z
 
-    channel1 = O
-    bevel_pos = config["channel"]["bevel"]["position"]
-    channel2 = vec3(bevel_pos, 0, 0)
-    bevel_theta = config["channel"]["bevel"]["angle"]
-    out_width = config["channel"]["outletWidth"] if bevel_theta >= 1 else config["channel"]["inletWidth"]
-    bevel_width = (config["channel"]["inletWidth"] - out_width)/2.0 if bevel_theta >= 1 else 0
-    channel3 = vec3(bevel_pos+bevel_width/math.tan(math.radians(bevel_theta)) if bevel_theta >= 1 else bevel_pos, bevel_width, 0)
-    channel4 = vec3(config["channel"]["length"], channel3[1], 0)
-    channel5 = channel4 + vec3(0, out_width, 0)
-    channel6 = channel3 + vec3(0, out_width, 0)
-    channel7 = channel2 + vec3(0, config["channel"]["inletWidth"], 0)
-    channel8 = channel1 + vec3(0, config["channel"]["inletWidth"], 0)
-    channel9 = channel8 - vec3(0, (config["channel"]["inletWidth"]-config["frontBluntBody"]["width"])/2.0, 0)
-    channel10 = channel9 + vec3(config["frontBluntBody"]["length"], 0, 0)
-    channel11 = channel10 - vec3(0, config["frontBluntBody"]["width"], 0)
-    channel12 = channel11 - vec3(config["frontBluntBody"]["length"], 0, 0)
+    channel1, channel2, channel3, channel4, channel5, channel6, channel7, channel8, \
+        channel9, channel10, channel11, channel12, \
+        channel13, channel14, channel15, channel16 = (vec3(x, y, 0) for x, y in channel_points(config).tolist())
 
     base_outline = web(Wire(points=[channel1, channel2, channel3, channel4,
                         channel5, channel6, channel7, channel8,
@@ -265,29 +307,22 @@ def generate_geometry():
     walls_1 = web(Wire(points=[channel1, channel2, channel3, channel4]))
     walls_2 = web(Wire(points=[channel5, channel6, channel7, channel8]))
     walls_mesh = union(extrusion(walls_1, extrude_dir), extrusion(walls_2, extrude_dir))
-    write(mesh=walls_mesh, name="walls", type="stl", mode=Mode.ASCII)
+    stl_patches = [(walls_mesh, "walls")]
 
     inlet1 = web(Wire(points=[channel8, channel9]))
     inlet2 = web(Wire(points=[channel12, channel1]))
     inlet1_mesh = extrusion(inlet1, extrude_dir)
     inlet2_mesh = extrusion(inlet2, extrude_dir)
-    write(mesh=inlet1_mesh, name="inletAir", type="stl", mode=Mode.ASCII)
-    write(mesh=inlet2_mesh, name="inletFuel", type="stl", mode=Mode.ASCII)
+    stl_patches += [(inlet1_mesh, "inletAir"), (inlet2_mesh, "inletFuel")]
 
     outlet = web(Wire(points=[channel4, channel5]))
     outlet_mesh = extrusion(outlet, extrude_dir)
-    write(mesh=outlet_mesh, name="outlet", type="stl", mode=Mode.ASCII)
+    stl_patches.append((outlet_mesh, "outlet"))
 
     front_body = web(Wire(points=[channel9, channel10, channel11, channel12]))
     front_body_mesh = extrusion(front_body, extrude_dir)
-    write(mesh=front_body_mesh, name="frontBody", type="stl", mode=Mode.ASCII)
-
-    rear_blunt_body_posY = (config["channel"]["inletWidth"]-config["rearBluntBody"]["width"])/2.0
+    stl_patches.append((front_body_mesh, "frontBody"))
 
-    channel13 = vec3(config["rearBluntBody"]["positionX"], rear_blunt_body_posY, 0)
-    channel14 = channel13 + vec3(config["rearBluntBody"]["length"], 0, 0)
-    channel15 = channel14 + vec3(0, config["rearBluntBody"]["width"], 0)
-    channel16 = channel13 + vec3(0, config["rearBluntBody"]["width"], 0)
     rear_rotation = rotatearound(config["rearBluntBody"]["rotationAngle"], (channel13+channel14+channel15+channel16)/4.0, Z)
 
     # rear_body_length < outlet width if its its x > channel3.x
@@ -296,18 +331,16 @@ def generate_geometry():
 
     rear_body = web(Wire(points=[channel13, channel14, channel15, channel16]).close().segmented())
     rear_body_mesh = extrusion(rear_body, extrude_dir).transform(rear_rotation)
-    write(mesh=rear_body_mesh, name="rearBody", type="stl", mode=Mode.ASCII)
+    stl_patches.append((rear_body_mesh, "rearBody"))
 
     vane1C = vec3(config["vane1"]["centerX"], config["vane1"]["centerY"], 0)
 
     def create_vane(vane_config):
         thickness = vane_config["thickness"]
-        l1 = vane_config["L1"]
-        r1 = rotatearound(math.radians(vane_config["angleLeg1"]), O, Z)
-        l2 = vane_config["L2"]
-        r2 = rotatearound(math.radians(vane_config["angleLeg2"]), O, Z)
-        leg1 = [O, r1 * vec3(0, l1, 0), r1 * vec3(thickness, l1, 0)]
-        leg2 = [r2 * vec3(l2, thickness, 0), r2 * vec3(l2, 0, 0)]
+        # Legs are rotated around Z through O, so take the rotated points
+        # from the shared helper instead of building rotatearound matrices
+        legs = [vec3(x, y, 0) for x, y in vane_leg_points(vane_config).tolist()]
+        leg1, leg2 = legs[:3], legs[3:]
         v1 = leg1[1] - leg1[0]       # direction of first leg's top edge
         p1 = leg1[2]
         v2 = leg2[1] - leg1[0]       # direction of second leg's top edge
@@ -328,8 +361,12 @@ def generate_geometry():
     guide_vane1_mesh = create_vane(config["vane1"])
     guide_vane2_mesh = create_vane(config["vane2"])
 
-    write(mesh=guide_vane1_mesh, name="vane1", type="stl", mode=Mode.ASCII)
-    write(mesh=guide_vane2_mesh, name="vane2", type="stl", mode=Mode.ASCII)
+    stl_patches += [(guide_vane1_mesh, "vane1"), (guide_vane2_mesh, "vane2")]
+
+    # ASCII STL is formatted in Python under the GIL, so the patch files are
+    # written one after the other
+    for mesh, name in stl_patches:
+        write(mesh=mesh, name=name, type="stl", mode=Mode.ASCII)
 
     def concat_and_remove(input_paths, out_path):
         import os, tempfile, shutil
@@ -343,7 +380,18 @@ def generate_geometry():
             with open(tmp_path, "wb") as wfd:
                 for p in input_paths:
                     with open(p, "rb") as rfd:
-                        shutil.copyfileobj(rfd, wfd)
+                        if sys.platform.startswith("linux"):
+                            # Copy in-kernel, without going through userspace buffers
+                            size = os.fstat(rfd.fileno()).st_size
+                            offset = 0
+                            while offset < size:
+                                sent = os.sendfile(wfd.fileno(), rfd.fileno(), offset, size - offset)
+                                if sent == 0:
+                                    # Source shrank under us: never leave a truncated avc.stl
+                                    raise OSError(f"Short copy of {p}: {offset} of {size} bytes")
+                                offset += sent
+                        else:
+                            shutil.copyfileobj(rfd, wfd, length=1 << 20)
             shutil.move(tmp_path, out_path)
             for p in input_paths:
                 try:
@@ -28,6 +28,30 @@ fi
 CASE_DIR="$1"
 METRIC="$2"
 LOG_FILE="${CASE_DIR}/log.reactingFoam"
+METRIC_SERVER_SOCKET="${METRIC_SERVER_SOCKET:-/tmp/data/metric_server.sock}"
+
+# Field-based metrics go through compute_metric_server.py when it is running
+# (avoids a ParaView import and reader construction per call), otherwise
+# through a fresh pvpython process
+compute_field_metric() {
+    local output
+    if [ -S "$METRIC_SERVER_SOCKET" ]; then
+        output=$(printf '%s\t%s\n' "$(realpath "$CASE_DIR")" "$1" | python3 -c '
+import socket, sys
+s = socket.socket(socket.AF_UNIX)
+s.connect(sys.argv[1])
+s.sendall(sys.stdin.buffer.read())
+sys.stdout.write(s.makefile().readline())
+' "$METRIC_SERVER_SOCKET" 2>/dev/null) || output=""
+    else
+        output=$(pvpython /tmp/data/scripts/compute_metric.py "$CASE_DIR" "$1" 2>/dev/null) || output=""
+    fi
+    if [ -z "$output" ]; then
+        echo "nan"
+    else
+        echo "$output"
+    fi
+}
 
 # Check if log file exists
 if [ ! -f "$LOG_FILE" ]; then
@@ -199,31 +223,8 @@ case "$METRIC" in
         ' "$LOG_FILE" 2>/dev/null || echo "nan"
         ;;
 
-    ch4_domain_average)
-        OUTPUT=$(pvpython /tmp/data/scripts/compute_metric.py "$CASE_DIR" ch4_domain_average 2>/dev/null)
-        if [ $? -ne 0 ] || [ -z "$OUTPUT" ]; then
-            echo "nan"
-        else
-            echo "$OUTPUT"
-        fi
-        ;;
-
-    pattern_factor)
-        OUTPUT=$(pvpython /tmp/data/scripts/compute_metric.py "$CASE_DIR" pattern_factor 2>/dev/null)
-        if [ $? -ne 0 ] || [ -z "$OUTPUT" ]; then
-            echo "nan"
-        else
-            echo "$OUTPUT"
-        fi
-        ;;
-
-    temperature_rise)
-        OUTPUT=$(pvpython /tmp/data/scripts/compute_metric.py "$CASE_DIR" temperature_rise 2>/dev/null)
-        if [ $? -ne 0 ] || [ -z "$OUTPUT" ]; then
-            echo "nan"
-        else
-            echo "$OUTPUT"
-        fi
+    ch4_domain_average|pattern_factor|temperature_rise)
+        compute_field_metric "$METRIC"
         ;;
 
     *)
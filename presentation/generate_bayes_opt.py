@@ -6,6 +6,7 @@
 #   "scipy",
 #   "bayesian-optimization",
 #   "packaging",
+#   "orjson",
 # ]
 # ///
 
@@ -14,41 +15,58 @@ Bayesian Optimization Visualization Data Generator
 Generates JSON data for animating Bayesian optimization steps
 """
 
+import math
 import numpy as np
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from bayes_opt import BayesianOptimization
 from bayes_opt.acquisition import ExpectedImprovement
+from scipy.optimize import minimize
 
 # Define the objective function
 def F1(x, k=1, m=0, lb=0.01):
     """Objective function with multiple local minima"""
     def z(x, k, m, lb):
         cond = np.abs(x) / k - np.floor(np.abs(x) / k)
-        return np.array([1 - m + (m / lb) * i if i < lb else 1 - m + (m / (1 - lb)) * (1 - i) for i in cond])
+        return np.where(cond < lb, 1 - m + (m / lb) * cond, 1 - m + (m / (1 - lb)) * (1 - cond))
 
     c = z(x, k, m, lb)
     p = (x - 40) * (x - 185) * x * (x + 50) * (x + 180)
     return 3e-9 * np.abs(p) * c + 10 * np.abs(np.sin(0.1 * x))
 
+def F1_scalar(x, k=1, m=0, lb=0.01):
+    """Scalar version of F1, for single evaluations by the optimizer"""
+    cond = abs(x) / k - math.floor(abs(x) / k)
+    c = 1 - m + (m / lb) * cond if cond < lb else 1 - m + (m / (1 - lb)) * (1 - cond)
+    p = (x - 40) * (x - 185) * x * (x + 50) * (x + 180)
+    return 3e-9 * abs(p) * c + 10 * abs(math.sin(0.1 * x))
+
 # Objective function for minimization (bayes_opt maximizes, so we negate)
 def obj_func(x):
-    return -F1(np.array([x]), 1, 0, 0.01)[0]
+    return -F1_scalar(x, 1, 0, 0.01)
 
 # Helper to get posterior predictions
 def posterior(optimizer, X):
-    """Get GP posterior mean and std at points X"""
-    # Fit the GP with current data
-    X_train = np.array([[res["params"]["x"]] for res in optimizer.res])
-    y_train = np.array([res["target"] for res in optimizer.res])
-    optimizer._gp.fit(X_train, y_train)
-
+    """Get GP posterior mean and std at points X (GP must be fitted on current data)"""
     mu, sigma = optimizer._gp.predict(X, return_std=True)
     return mu, sigma
 
+# Helper to pick the next sample from EI already evaluated on the plot grid
+def suggest_from_grid(optimizer, acq_function, X, ei):
+    """Polish the best grid point of EI with one L-BFGS-B run (GP must be fitted, y_max set)"""
+    def neg_ei(x):
+        mu, sigma = posterior(optimizer, x.reshape(1, -1))
+        return -acq_function.base_acq(mu, sigma)[0]
+
+    x0 = X[np.argmax(ei)]
+    res = minimize(neg_ei, x0, bounds=optimizer.space.bounds, method="L-BFGS-B")
+    return optimizer.space.array_to_params(res.x if res.success else x0)
+
 # Generate data
 np.random.seed(100)  # Same seed as in presentation for consistency
 x_range = np.linspace(-200, 200, 500)
+X_pred = x_range.reshape(-1, 1)
 y_true = F1(x_range, 1, 0, 0.01)
 
 # Acquisition function (Expected Improvement)
@@ -82,6 +100,12 @@ all_components = []
 def add_component(comp_dict):
     all_components.append(comp_dict)
 
+# Curves are only drawn, so float32-level precision is plenty; rounding
+# keeps the JSON numbers short. Arrays are kept as ndarrays, orjson
+# serializes them natively when the states are written
+def plot_values(arr):
+    return np.round(arr, 4)
+
 # Helper function to filter components active at a specific state index
 def get_active_components(state_idx):
     return [
@@ -99,7 +123,7 @@ add_component({
     "id": "true_objective",
     "type": "line",
     "label": "True Objective",
-    "data": y_true.tolist(),
+    "data": plot_values(y_true),
     "color": "#1e66f5",  # Blue throughout
     "strokeWidth": 2,
     "showPoints": False,
@@ -109,8 +133,8 @@ add_component({
 })
 
 # Component 2: Initial samples (visible from state 1 onwards)
-xx = np.array([[res["params"]["x"]] for res in optimizer.res])
-yy = np.array([res["target"] for res in optimizer.res])
+xx = optimizer.space.params
+yy = optimizer.space.target
 initial_samples = [{"x": float(xx[i][0]), "y": float(-yy[i])} for i in range(n_init)]
 
 add_component({
@@ -136,8 +160,11 @@ state_idx = 2  # States 0 and 1 are initial states
 for iteration in range(n_iterations):
     print(f"Processing iteration {iteration}...")
 
+    # Fit the GP on the current samples once, the grid predictions and the
+    # choice of the next point below all reuse that fit
+    optimizer._gp.fit(optimizer.space.params, optimizer.space.target)
+
     # Get current GP predictions
-    X_pred = x_range.reshape(-1, 1)
     mu, sigma = posterior(optimizer, X_pred)
 
     # Negate back to get minimization values
@@ -160,12 +187,15 @@ for iteration in range(n_iterations):
     else:
         ei_normalized = np.ones_like(ei) * 25  # Middle of [0, 50] range if no variation
 
+    # Warm-start the acquisition search from the grid EI maximum
+    next_point = suggest_from_grid(optimizer, acq_function, X_pred, ei)
+
     # State A: GP Mean only (1 state)
     add_component({
         "id": f"gp_mean_{iteration}",
         "type": "line",
         "label": "GP Mean",
-        "data": mu.tolist(),
+        "data": plot_values(mu),
         "color": "#fab387",  # Peach
         "strokeWidth": 3,
         "showPoints": False,
@@ -181,8 +211,8 @@ for iteration in range(n_iterations):
         "type": "area",
         "label": "95% Confidence",
         "data": {
-            "upper": ci_upper.tolist(),
-            "lower": ci_lower.tolist()
+            "upper": plot_values(ci_upper),
+            "lower": plot_values(ci_lower)
         },
         "color": "#cba6f7",  # Mauve
         "strokeWidth": 1,
@@ -196,7 +226,7 @@ for iteration in range(n_iterations):
         "id": f"ei_{iteration}",
         "type": "line",
         "label": "Expected Improvement",
-        "data": ei_normalized.tolist(),
+        "data": plot_values(ei_normalized),
         "color": "#f38ba8",  # Red
         "strokeWidth": 2,
         "showPoints": False,
@@ -206,8 +236,8 @@ for iteration in range(n_iterations):
     })
     state_idx += 1
 
-    # Perform one optimization iteration
-    optimizer.maximize(init_points=0, n_iter=1)
+    # Perform one optimization iteration (evaluate the suggested point)
+    optimizer.probe(next_point, lazy=False)
 
     # Get the new sample point
     new_x = optimizer.res[-1]["params"]["x"]
@@ -228,10 +258,6 @@ for iteration in range(n_iterations):
     })
     state_idx += 1
 
-    # Update data arrays
-    xx = np.array([[res["params"]["x"]] for res in optimizer.res])
-    yy = np.array([res["target"] for res in optimizer.res])
-
 # ==============================================================================
 # FINAL CONVERGED STATE
 # ==============================================================================
@@ -239,6 +265,7 @@ for iteration in range(n_iterations):
 # Run additional iterations silently
 additional_iterations = 15
 for i in range(additional_iterations):
+    # Nothing is plotted here, so keep maximize()'s own search with random restarts
     optimizer.maximize(init_points=0, n_iter=1)
     # Add each additional sample point to be visible in final state
     new_x = optimizer.res[-1]["params"]["x"]
@@ -257,10 +284,9 @@ for i in range(additional_iterations):
     })
 
 # Final predictions
-xx_final = np.array([[res["params"]["x"]] for res in optimizer.res])
-yy_final = np.array([res["target"] for res in optimizer.res])
+# The GP was last fitted before the final probe, so refit on all samples once
+optimizer._gp.fit(optimizer.space.params, optimizer.space.target)
 
-X_pred = x_range.reshape(-1, 1)
 mu_final, sigma_final = posterior(optimizer, X_pred)
 mu_final = -mu_final  # Negate back
 ci_upper_final = mu_final + 1.96 * sigma_final
@@ -271,7 +297,7 @@ add_component({
     "id": f"gp_mean_final",
     "type": "line",
     "label": "GP Mean (Converged)",
-    "data": mu_final.tolist(),
+    "data": plot_values(mu_final),
     "color": "#fab387",  # Peach
     "strokeWidth": 3,
     "showPoints": False,
@@ -286,8 +312,8 @@ add_component({
     "type": "area",
     "label": "95% Confidence",
     "data": {
-        "upper": ci_upper_final.tolist(),
-        "lower": ci_lower_final.tolist()
+        "upper": plot_values(ci_upper_final),
+        "lower": plot_values(ci_lower_final)
     },
     "color": "#cba6f7",  # Mauve
     "strokeWidth": 1,
@@ -324,7 +350,7 @@ for idx in range(15):  # States 0-14
 
     state_data = {
         "currentState": idx,
-        "labels": x_range.tolist(),
+        "labels": x_range,  # Shared by all states, serialized by orjson
         "components": active_components,
         "xRange": [-200, 200],
         "yRange": [0, 180],
@@ -341,17 +367,21 @@ for idx in range(15):  # States 0-14
 # SAVE FILES
 # ==============================================================================
 
-# Save states to individual JSON files
-for i, state in enumerate(states):
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+def write_state(i, state):
     filename = output_dir / f"state-{i:02d}.json"
-    with open(filename, 'w') as f:
-        json.dump(state["data"], f, indent=2)
-    print(f"Generated: {filename}")
+    filename.write_bytes(orjson.dumps(state["data"], option=JSON_OPTIONS))
+    return filename
+
+# Save states to individual JSON files, the writes are independent
+with ThreadPoolExecutor(max_workers=8) as executor:
+    for filename in executor.map(write_state, range(len(states)), states):
+        print(f"Generated: {filename}")
 
 # Save state labels for reference
 labels_file = output_dir / "labels.json"
-with open(labels_file, 'w') as f:
-    json.dump([{"index": i, "label": state["label"]} for i, state in enumerate(states)], f, indent=2)
+labels_file.write_bytes(orjson.dumps([{"index": i, "label": state["label"]} for i, state in enumerate(states)], option=JSON_OPTIONS))
 
 total_samples = len(optimizer.res)
 
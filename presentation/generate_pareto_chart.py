@@ -2,6 +2,8 @@
 # /// script
 # dependencies = [
 #   "plotly",
+#   "orjson",
+#   "numpy",
 # ]
 # ///
 
@@ -10,15 +12,41 @@ Generate Pareto frontier visualization for multi-objective Bayesian optimization
 Exports to JSON format compatible with PlotlyChart component.
 """
 
-import json
-import plotly.graph_objects as go
+import hashlib
+import os
+import sys
+from importlib.metadata import version
 from pathlib import Path
 
 # Define the output path
 output_dir = Path(__file__).parent / "public" / "pareto"
-output_dir.mkdir(parents=True, exist_ok=True)
+if not output_dir.is_dir():  # one stat on the usual warm path
+    output_dir.mkdir(parents=True, exist_ok=True)
 output_file = output_dir / "pareto-frontier-plotly.json"
 
+# The chart is fully determined by this script and plotly's default
+# template, so skip regenerating when neither changed since the last export
+# and the exported file still holds what was written then (it may have been
+# edited, or reverted by git). The key and the digest of the written bytes
+# live next to this script: everything under public/ is published
+hash_file = Path(__file__).with_name(f".{output_file.name}.hash")
+cache_key = hashlib.blake2b(
+    Path(__file__).read_bytes() + version("plotly").encode()
+).hexdigest()
+try:
+    up_to_date = hash_file.read_text().split() == [
+        cache_key, hashlib.blake2b(output_file.read_bytes()).hexdigest()
+    ]
+except FileNotFoundError:
+    up_to_date = False
+if up_to_date:
+    print(f"✓ Pareto frontier chart is up to date: {output_file}")
+    sys.exit(0)
+
+# Heavy imports only past the cache check, so up-to-date runs skip them
+import numpy as np
+import orjson
+
 # Catppuccin Mocha color palette
 COLORS = {
     'blue': '#89b4fa',
@@ -28,57 +56,106 @@ COLORS = {
     'mauve': '#cba6f7',
 }
 
-# Define trial points
-all_trials_x = [2.8, 3.2, 3.9, 4.6, 5.3, 6.1, 6.9, 7.6, 4.5, 5.7, 6.7, 7.4, 8.2, 6.0, 7.3, 8.7]
-all_trials_y = [7.5, 6.2, 5.5, 4.0, 3.2, 2.6, 2.0, 1.6, 7.0, 5.8, 4.8, 4.2, 3.5, 7.5, 6.2, 5.0]
+# Coordinates are float32 arrays: plenty for a chart, and orjson writes
+# them with their short float32 representation
+
+# Plot ranges of both objectives
+X_RANGE = [1.5, 10]
+Y_RANGE = [0, 9]
+
+def is_pareto_front(points):
+    """Mask of the non-dominated rows of an (N, 2) array, both objectives minimized"""
+    # Sort by objective 1 (ties by objective 2); a point is then on the front
+    # iff its objective 2 beats the running minimum of all points before it
+    order = np.lexsort(points.T[::-1])
+    sorted_points = points[order]
+    cummin = np.minimum.accumulate(sorted_points[:, 1])
+    on_front = np.zeros(len(points), dtype=bool)
+    on_front[order[0]] = True
+    on_front[order[1:]] = sorted_points[1:, 1] < cummin[:-1]
+    return on_front
+
+# Define trial points, one (2, N) array: row 0 is objective 1, row 1 objective 2
+all_trials = np.array([
+    [2.8, 3.2, 3.9, 4.6, 5.3, 6.1, 6.9, 7.6, 4.5, 5.7, 6.7, 7.4, 8.2, 6.0, 7.3, 8.7],
+    [7.5, 6.2, 5.5, 4.0, 3.2, 2.6, 2.0, 1.6, 7.0, 5.8, 4.8, 4.2, 3.5, 7.5, 6.2, 5.0],
+], dtype=np.float32)
+on_front = is_pareto_front(all_trials.T)
 
-# Pareto optimal points (non-dominated)
-pareto_x = [2.8, 3.2, 3.9, 4.6, 5.3, 6.1, 6.9, 7.6]
-pareto_y = [7.5, 6.2, 5.5, 4.0, 3.2, 2.6, 2.0, 1.6]
+# Pareto optimal points (non-dominated), sorted along objective 1 so the
+# frontier line is drawn left to right; the x/y rows are views shared by
+# the frontier trace and both region polygons
+front = np.flatnonzero(on_front)
+front = front[np.argsort(all_trials[0, front], kind='stable')]
+pareto = np.ascontiguousarray(all_trials[:, front])
+pareto_x, pareto_y = pareto
+(first_x, first_y), (last_x, last_y) = pareto[:, 0], pareto[:, -1]
 
 # Dominated points
-dominated_x = [4.5, 5.7, 6.7, 7.4, 8.2, 6.0, 7.3, 8.7]
-dominated_y = [7.0, 5.8, 4.8, 4.2, 3.5, 7.5, 6.2, 5.0]
+dominated_x, dominated_y = np.ascontiguousarray(all_trials[:, ~on_front])
 
 # Candidate trial locations
-candidate_x = [3.0, 4.2, 6.0, 3.6]
-candidate_y = [6.8, 4.6, 2.3, 5.0]
+candidate_x = np.asarray([3.0, 4.2, 6.0, 3.6], dtype=np.float32)
+candidate_y = np.asarray([6.8, 4.6, 2.3, 5.0], dtype=np.float32)
 
-# Create figure
-fig = go.Figure()
+def svg_path(xs, ys):
+    """Closed SVG path through the given float32 vertices, for layout shapes"""
+    # str() of a float32 scalar is its short form; format() would widen it
+    return 'M ' + ' L '.join(f'{x!s} {y!s}' for x, y in zip(xs, ys)) + ' Z'
+
+# Acquisition regions are static backdrops: layout shapes carry them as
+# one SVG path string each and still get a legend entry (ranked ahead of
+# the traces, as when they were fill traces)
+shapes = []
 
 # Add high acquisition value region (below Pareto frontier)
-promising_x = [1.5, 2.8] + pareto_x + [7.6, 1.5]
-promising_y = [0, 7.5] + pareto_y + [0, 0]
-fig.add_trace(go.Scatter(
-    x=promising_x,
-    y=promising_y,
-    fill='toself',
-    fillcolor=f'rgba(137, 220, 235, 0.35)',  # Cyan with transparency
+promising_x, promising_y = np.concatenate((
+    [[X_RANGE[0]], [Y_RANGE[0]]],
+    pareto,
+    [[last_x], [Y_RANGE[0]]],
+), axis=1, dtype=np.float32)
+shapes.append(dict(
+    type='path',
+    path=svg_path(promising_x, promising_y),
+    xref='x',
+    yref='y',
+    fillcolor='rgba(137, 220, 235, 0.35)',  # Cyan with transparency
     line=dict(width=0),
-    mode='lines',
+    layer='below',
     name='High Acquisition Value',
     showlegend=True,
-    hoverinfo='name'
+    legendrank=1
 ))
 
 # Add dominated region (above Pareto frontier)
-dominated_region_x = [2.8, 2.8] + pareto_x + [10, 10, 2.8]
-dominated_region_y = [9, 7.5] + pareto_y + [1.6, 9, 9]
-fig.add_trace(go.Scatter(
-    x=dominated_region_x,
-    y=dominated_region_y,
-    fill='toself',
-    fillcolor=f'rgba(243, 139, 168, 0.2)',  # Red with transparency
+dominated_region_x, dominated_region_y = np.concatenate((
+    [[first_x], [Y_RANGE[1]]],
+    pareto,
+    [[X_RANGE[1], X_RANGE[1]], [last_y, Y_RANGE[1]]],
+), axis=1, dtype=np.float32)
+shapes.append(dict(
+    type='path',
+    path=svg_path(dominated_region_x, dominated_region_y),
+    xref='x',
+    yref='y',
+    fillcolor='rgba(243, 139, 168, 0.2)',  # Red with transparency
     line=dict(width=0),
-    mode='lines',
+    layer='below',
     name='Low Acquisition Value',
     showlegend=True,
-    hoverinfo='name'
+    legendrank=2
 ))
 
+# Hover label shared by all marker traces, titled with the trace name
+HOVERTEMPLATE = '<b>%{fullData.name}</b><br>Obj 1: %{x:.2f}<br>Obj 2: %{y:.2f}<extra></extra>'
+
+# Create traces as plain dicts: the values are already in final form, so
+# plotly's property validators (go.Figure/go.Scatter) are skipped entirely
+data = []
+
 # Add dominated trial points
-fig.add_trace(go.Scatter(
+data.append(dict(
+    type='scatter',
     x=dominated_x,
     y=dominated_y,
     mode='markers',
@@ -88,11 +165,12 @@ fig.add_trace(go.Scatter(
         color=COLORS['red'],
         line=dict(width=1, color='white')
     ),
-    hovertemplate='<b>Dominated Trial</b><br>Obj 1: %{x:.2f}<br>Obj 2: %{y:.2f}<extra></extra>'
+    hovertemplate=HOVERTEMPLATE
 ))
 
 # Add Pareto frontier (line + markers)
-fig.add_trace(go.Scatter(
+data.append(dict(
+    type='scatter',
     x=pareto_x,
     y=pareto_y,
     mode='markers+lines',
@@ -106,11 +184,12 @@ fig.add_trace(go.Scatter(
         color=COLORS['green'],
         width=3
     ),
-    hovertemplate='<b>Pareto Optimal</b><br>Obj 1: %{x:.2f}<br>Obj 2: %{y:.2f}<extra></extra>'
+    hovertemplate=HOVERTEMPLATE
 ))
 
 # Add candidate trial locations
-fig.add_trace(go.Scatter(
+data.append(dict(
+    type='scatter',
     x=candidate_x,
     y=candidate_y,
     mode='markers',
@@ -121,21 +200,27 @@ fig.add_trace(go.Scatter(
         symbol='diamond',
         line=dict(width=2, color='white')
     ),
-    hovertemplate='<b>Candidate Trial</b><br>Obj 1: %{x:.2f}<br>Obj 2: %{y:.2f}<extra></extra>'
+    hovertemplate=HOVERTEMPLATE
 ))
 
-# Update layout
-fig.update_layout(
+def default_template():
+    """The default template go.Figure would have attached, as a plain dict"""
+    import plotly.io as pio  # pulls in most of plotly, only needed here
+    return pio.templates[pio.templates.default].to_plotly_json()
+
+# Layout
+layout = dict(
+    template=default_template(),
     xaxis=dict(
-        title='Objective 1 (minimize)',
-        range=[1.5, 10],
+        title=dict(text='Objective 1 (minimize)'),
+        range=X_RANGE,
         showgrid=True,
         gridcolor='rgba(128, 128, 128, 0.2)',
         zeroline=False
     ),
     yaxis=dict(
-        title='Objective 2 (minimize)',
-        range=[0, 9],
+        title=dict(text='Objective 2 (minimize)'),
+        range=Y_RANGE,
         showgrid=True,
         gridcolor='rgba(128, 128, 128, 0.2)',
         zeroline=False
@@ -153,20 +238,28 @@ fig.update_layout(
     plot_bgcolor='rgba(0,0,0,0)',
     paper_bgcolor='rgba(0,0,0,0)',
     hovermode='closest',
+    shapes=shapes,
     margin=dict(l=60, r=180, t=40, b=60)
 )
 
 # Export to JSON
-# Plotly's to_json() returns a string, but we want a properly formatted dict
-fig_dict = fig.to_dict()
-fig.show()
+fig_dict = dict(data=data, layout=layout)
 
-# Write to file with pretty formatting
-with open(output_file, 'w') as f:
-    json.dump(fig_dict, f, indent=2)
+# Write to file as compact JSON (PlotlyChart only parses it), encoded in
+# one orjson call and handed to os.write on a raw fd: no file object or
+# buffering layer in between
+buf = orjson.dumps(fig_dict, option=orjson.OPT_SERIALIZE_NUMPY)
+fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+try:
+    written = 0
+    while written < len(buf):  # regular files write it all in one go
+        written += os.write(fd, buf[written:])
+finally:
+    os.close(fd)
+hash_file.write_text(f"{cache_key} {hashlib.blake2b(buf).hexdigest()}\n")
 
 print(f"✓ Pareto frontier chart exported to: {output_file}")
-print(f"  - {len(fig.data)} data traces")
-print(f"  - Output size: {output_file.stat().st_size / 1024:.1f} KB")
+print(f"  - {len(data)} data traces, {len(shapes)} region shapes")
+print(f"  - Output size: {len(buf) / 1024:.1f} KB")
 print("\nUsage in slides.md:")
-print(f'<PlotlyChart data="/pareto/pareto-frontier-plotly.json" :height="400" />')
+print('<PlotlyChart data="/pareto/pareto-frontier-plotly.json" :height="400" />')